@@ -10,14 +10,24 @@ Features:
 - Improved symbol designs with better definition
 - Optimized line widths for small display sizes
 - Enhanced contrast for visibility
+- Vectorized rasterization: each shape is one NumPy evaluation over the
+  full (pixel x subpixel) sample grid, so a full run is dominated by
+  interpreter start-up and needs no JIT compiler
+
+Requires Python 3.10+ (dataclass slots) and NumPy.
 
 Usage:
     python generate_circular_icons.py > ../main/ui/assets/circular_icons.hpp
 """
 
+import functools
+import io
 import math
+import sys
 from dataclasses import dataclass
-from typing import List, Tuple, Callable
+from typing import Tuple, Callable
+
+import numpy as np
 
 # Icon dimensions matching factory demo
 ICON_SIZE = 42
@@ -41,93 +51,176 @@ ICON_COLORS = {
 # Selector/label color (cream)
 SELECTOR_COLOR = 0xF3E9  # 0xF3E9D2
 
-# RGB565 conversion utilities
-def rgb_to_565(r: int, g: int, b: int) -> int:
-    """Convert 8-bit RGB to RGB565."""
-    return ((r & 0xF8) << 8) | ((g & 0xFC) << 3) | (b >> 3)
-
-def rgb565_to_rgb(color: int) -> Tuple[int, int, int]:
-    """Convert RGB565 to 8-bit RGB."""
-    r = ((color >> 11) & 0x1F) << 3
-    g = ((color >> 5) & 0x3F) << 2
-    b = (color & 0x1F) << 3
-    return (r, g, b)
-
-def blend_rgb(fg: Tuple[int, int, int], bg: Tuple[int, int, int], alpha: float) -> Tuple[int, int, int]:
-    """Alpha blend two RGB colors."""
-    r = int(fg[0] * alpha + bg[0] * (1 - alpha))
-    g = int(fg[1] * alpha + bg[1] * (1 - alpha))
-    b = int(fg[2] * alpha + bg[2] * (1 - alpha))
-    return (r, g, b)
-
-def blend_565(fg: int, bg: int, alpha: float) -> int:
-    """Alpha blend two RGB565 colors."""
-    fg_rgb = rgb565_to_rgb(fg)
-    bg_rgb = rgb565_to_rgb(bg)
-    result_rgb = blend_rgb(fg_rgb, bg_rgb, alpha)
-    return rgb_to_565(*result_rgb)
-
-def distance(x1: float, y1: float, x2: float, y2: float) -> float:
-    """Euclidean distance."""
-    return math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
-
-def clamp(val: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
-    """Clamp value to range."""
-    return max(min_val, min(max_val, val))
-
-@dataclass
+# RGB565 blending utilities
+def split_565(color: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Split RGB565 into two blend lanes: (R << 16) | B and G."""
+    color = np.asarray(color, dtype=np.uint32)
+    rb = ((color >> 11) << 16) | (color & 0x1F)
+    g = (color >> 5) & 0x3F
+    return rb, g
+
+def quantize_alpha(coverage: np.ndarray) -> np.ndarray:
+    """Quantize 0.0-1.0 coverage to 8-bit fixed point (0-255)."""
+    return np.rint(np.asarray(coverage) * 255).astype(np.uint8)
+
+def div255(x: np.ndarray, lanes: int = 0x00FF00FF) -> np.ndarray:
+    """
+    Rounded x / 255 per 16-bit lane (Blinn's INT_MULT identity).
+
+    lanes masks the low byte of each lane in use: 0x00FF00FF for a packed
+    (R << 16) | B value, 0xFF for a single lane.
+    """
+    t = x + 0x80 * (lanes & 0x10001)  # +0x80 rounding bias in each lane
+    return (t + ((t >> 8) & lanes)) >> 8
+
+def blend_565(fg, bg, alpha: np.ndarray) -> np.ndarray:
+    """
+    Alpha blend two RGB565 colors (element-wise, integer only).
+
+    alpha is 8-bit fixed point (see quantize_alpha). R and B share one
+    uint32 with a 16-bit lane each, so both channels are blended with a
+    single multiply-add; G is blended in a second lane.
+    """
+    a = np.asarray(alpha, dtype=np.uint32)
+    rb_fg, g_fg = split_565(fg)
+    rb_bg, g_bg = split_565(bg)
+    rb = div255(rb_fg * a + rb_bg * (255 - a)) & 0x1F001F
+    g = div255(g_fg * a + g_bg * (255 - a), lanes=0xFF)
+    return ((rb >> 16) << 11) | (g << 5) | (rb & 0x1F)
+
+def distance(x1, y1, x2, y2) -> np.ndarray:
+    """Euclidean distance (element-wise over sample arrays)."""
+    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+def distance_sq(x1, y1, x2, y2) -> np.ndarray:
+    """Squared Euclidean distance, for comparisons that don't need sqrt."""
+    dx = x2 - x1
+    dy = y2 - y1
+    return dx * dx + dy * dy
+
+def disc_coverage(dist_sq: np.ndarray, radius: float,
+                  inner_sq: float, outer_sq: float) -> np.ndarray:
+    """
+    AA coverage of a filled disc from squared sample distances.
+
+    inner_sq/outer_sq are (radius -/+ 0.5) ** 2; sqrt is only taken for
+    samples inside that edge band, everything else is 0.0 or 1.0.
+    """
+    coverage = (dist_sq <= inner_sq).astype(np.float64)
+    edge = (dist_sq > inner_sq) & (dist_sq < outer_sq)
+    coverage[edge] = clamp(radius + 0.5 - np.sqrt(dist_sq[edge]))
+    return coverage
+
+def clamp(val, min_val: float = 0.0, max_val: float = 1.0) -> np.ndarray:
+    """Clamp value to range (element-wise, branchless min/max)."""
+    return np.clip(val, min_val, max_val)
+
+@dataclass(frozen=True, slots=True)
 class IconDef:
     """Definition for generating an icon."""
     name: str
     bg_color: int  # RGB565
     symbol: str    # Type of symbol to draw
 
-def sample_pixel_aa(x: int, y: int, size: int, shape_func: Callable[[float, float], float]) -> float:
+ShapeFunc = Callable[..., np.ndarray]
+
+@functools.lru_cache(maxsize=None)
+def build_sample_grid(size: int) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Sample a pixel with multi-sample anti-aliasing.
-    shape_func returns 0.0-1.0 coverage for a point.
+    Build (X, Y) AA sample coordinates for a size x size icon.
+
+    Both arrays have shape (size, size, AA_SAMPLES, AA_SAMPLES): pixel row,
+    pixel column, then the subpixel sample row/column inside that pixel.
     """
-    total = 0.0
     step = 1.0 / AA_SAMPLES
     offset = step / 2
     
-    for sy in range(AA_SAMPLES):
-        for sx in range(AA_SAMPLES):
-            sample_x = x + offset + sx * step
-            sample_y = y + offset + sy * step
-            total += shape_func(sample_x, sample_y)
+    pix = np.arange(size) + offset
+    sub = np.arange(AA_SAMPLES) * step
+    X = pix[None, :, None, None] + sub[None, None, None, :]
+    Y = pix[:, None, None, None] + sub[None, None, :, None]
+    grid = tuple(np.ascontiguousarray(a) for a in np.broadcast_arrays(X, Y))
+    for a in grid:
+        a.flags.writeable = False  # Shared between shapes via the cache
+    return grid
+
+@functools.lru_cache(maxsize=None)
+def polar_grid(size: int, cx: float, cy: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Distance and angle of every AA sample of a size x size icon relative
+    to (cx, cy). Cached, so symbols sharing a center share one sqrt/atan2
+    pass over the sample grid.
+    """
+    X, Y = build_sample_grid(size)
+    grid = (distance(X, Y, cx, cy), np.arctan2(Y - cy, X - cx))
+    for a in grid:
+        a.flags.writeable = False
+    return grid
+
+BBox = Tuple[float, float, float, float]
+
+def pixel_region(size: int, bbox: BBox) -> Tuple[slice, slice]:
+    """Pixel rows/columns whose samples can fall inside bbox (x0, y0, x1, y1)."""
+    x0, y0, x1, y1 = bbox
+    rows = slice(max(0, math.floor(y0)), max(0, min(size, math.floor(y1) + 1)))
+    cols = slice(max(0, math.floor(x0)), max(0, min(size, math.floor(x1) + 1)))
+    return rows, cols
+
+def sample_pixel_aa(size: int, shape_func: ShapeFunc, bbox: BBox = None,
+                    polar: Tuple[np.ndarray, ...] = ()) -> np.ndarray:
+    """
+    Sample a size x size grid with multi-sample anti-aliasing.
+
+    shape_func receives (X, Y) sample coordinate arrays (see
+    build_sample_grid), followed by the matching slices of any polar
+    tables, and returns 0.0-1.0 coverage for each sample. When bbox gives
+    the shape's extent, only pixels inside it are evaluated; the rest of
+    the returned (size, size) coverage map is 0.0.
+    """
+    X, Y = build_sample_grid(size)
+    region = (slice(None), slice(None)) if bbox is None else pixel_region(size, bbox)
+    
+    args = [a[region] for a in (X, Y) + tuple(polar)]
     
-    return total / (AA_SAMPLES * AA_SAMPLES)
+    coverage = np.zeros((size, size))
+    if args[0].size == 0:
+        return coverage  # bbox lies entirely off the grid
+    samples = np.broadcast_to(shape_func(*args), args[0].shape)
+    coverage[region] = samples.mean(axis=(-1, -2))
+    return coverage
 
-def generate_circle_background(size: int, color: int, transparent: int = 0x0000) -> List[int]:
-    """Generate a filled circle on transparent background with AA."""
-    pixels = []
+@functools.lru_cache(maxsize=None)
+def _circle_coverage_mask(size: int) -> np.ndarray:
+    """AA coverage of the circular background; identical for every icon."""
     cx = cy = size / 2 - 0.5
     radius = size / 2 - 0.5
-    
-    def circle_coverage(x: float, y: float) -> float:
-        dist = distance(x, y, cx, cy)
-        if dist <= radius - 0.5:
-            return 1.0
-        elif dist >= radius + 0.5:
-            return 0.0
-        else:
-            return clamp(radius + 0.5 - dist)
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, circle_coverage)
-            if coverage > 0.01:
-                pixels.append(blend_565(color, transparent, coverage))
-            else:
-                pixels.append(transparent)
-    
-    return pixels
+    inner_sq = (radius - 0.5) ** 2
+    outer_sq = (radius + 0.5) ** 2
+
+    def circle_coverage(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return disc_coverage(distance_sq(x, y, cx, cy), radius, inner_sq, outer_sq)
+
+    mask = quantize_alpha(sample_pixel_aa(size, circle_coverage))
+    mask.flags.writeable = False  # Shared between icons via the cache
+    return mask
+
+def rasterize_icon(size: int, bg_color: int, symbol_alpha: np.ndarray,
+                   symbol_color: int, transparent: int = 0x0000) -> np.ndarray:
+    """
+    Composite a symbol over the circular background in a single pass.
 
-def draw_gear_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+    symbol_alpha is the symbol's per-pixel opacity (AA coverage times the
+    symbol's ink strength), as returned by the draw_*_symbol functions.
+    """
+    bg_alpha = _circle_coverage_mask(size).ravel()
+    background = blend_565(bg_color, transparent, bg_alpha)
+    fg_alpha = quantize_alpha(symbol_alpha.ravel())
+    return blend_565(symbol_color, background, fg_alpha).astype(np.uint16)
+
+def draw_gear_symbol(size: int) -> np.ndarray:
     """Draw a crisp gear/settings symbol with clean edges."""
     cx = cy = size / 2 - 0.5
-    
+
     # Gear parameters - refined for crispness
     outer_r = size / 2 - 7.5    # Outer radius of gear body
     inner_r = outer_r * 0.6     # Inner radius (before teeth)
@@ -135,180 +228,157 @@ def draw_gear_symbol(pixels: List[int], size: int, fg_color: int) -> None:
     num_teeth = 8
     tooth_width = 0.35          # As fraction of tooth spacing (radians)
     tooth_height = 3.5          # Tooth protrusion
-    
-    def gear_coverage(x: float, y: float) -> float:
-        dist = distance(x, y, cx, cy)
-        
-        # Center hole
-        if dist <= hole_r - 0.5:
-            return 0.0
-        if dist < hole_r + 0.5:
-            return clamp(dist - hole_r + 0.5)
-        
-        # Calculate angle for gear teeth
-        angle = math.atan2(y - cy, x - cx)
-        tooth_angle = (2 * math.pi) / num_teeth
-        
+
+    # Derived constants (hoisted out of the per-sample closure)
+    tooth_angle = (2 * math.pi) / num_teeth
+    inv_tooth_angle = num_teeth / (2 * math.pi)
+    center_of_tooth = tooth_angle / 2
+    half_tooth_ang = tooth_width * tooth_angle / 2
+    tooth_outer_r = outer_r + tooth_height
+    extent = tooth_outer_r + 0.5
+
+    def gear_coverage(x: np.ndarray, y: np.ndarray,
+                      dist: np.ndarray, angle: np.ndarray) -> np.ndarray:
         # Normalize angle to [0, tooth_angle)
-        normalized_angle = ((angle % tooth_angle) + tooth_angle) % tooth_angle
-        center_of_tooth = tooth_angle / 2
-        dist_from_center = abs(normalized_angle - center_of_tooth)
-        
+        normalized_angle = angle - tooth_angle * np.floor(angle * inv_tooth_angle)
+        dist_from_center = np.abs(normalized_angle - center_of_tooth)
+
         # Determine effective outer radius based on tooth position
-        on_tooth = dist_from_center < (tooth_width * tooth_angle / 2)
-        
-        if on_tooth:
-            effective_outer = outer_r + tooth_height
-            # Tooth sides - sharp edge
-            tooth_edge_dist = (tooth_width * tooth_angle / 2) - dist_from_center
-            tooth_edge_factor = clamp(tooth_edge_dist * 15)  # Sharp falloff
-        else:
-            effective_outer = outer_r
-            tooth_edge_factor = 1.0
-        
+        on_tooth = dist_from_center < half_tooth_ang
+
+        effective_outer = np.where(on_tooth, tooth_outer_r, outer_r)
+        # Tooth sides - sharp edge
+        tooth_edge_dist = half_tooth_ang - dist_from_center
+        tooth_edge_factor = np.where(on_tooth, clamp(tooth_edge_dist * 15), 1.0)  # Sharp falloff
+
+        # Inner/outer edge AA (saturates to 1.0 away from the edges)
+        inner_factor = clamp(dist - inner_r + 0.5)
+        outer_factor = clamp(effective_outer + 0.5 - dist)
+
         # Main gear body
-        if dist >= inner_r - 0.5 and dist <= effective_outer + 0.5:
-            # Inner edge AA
-            if dist < inner_r + 0.5:
-                inner_factor = clamp(dist - inner_r + 0.5)
-            else:
-                inner_factor = 1.0
-            
-            # Outer edge AA
-            if dist > effective_outer - 0.5:
-                outer_factor = clamp(effective_outer + 0.5 - dist)
-            else:
-                outer_factor = 1.0
-            
-            return inner_factor * outer_factor * tooth_edge_factor
-        
-        return 0.0
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, gear_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.95)
-
-def draw_target_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+        in_body = (dist >= inner_r - 0.5) & (dist <= effective_outer + 0.5)
+        coverage = np.where(in_body, inner_factor * outer_factor * tooth_edge_factor, 0.0)
+
+        # Center hole
+        coverage = np.where(dist < hole_r + 0.5, clamp(dist - hole_r + 0.5), coverage)
+        return np.where(dist <= hole_r - 0.5, 0.0, coverage)
+
+    bbox = (cx - extent, cy - extent, cx + extent, cy + extent)
+    return sample_pixel_aa(size, gear_coverage, bbox, polar_grid(size, cx, cy)) * 0.95
+
+def draw_target_symbol(size: int) -> np.ndarray:
     """Draw a crisp target/crosshair symbol."""
     cx = cy = size / 2 - 0.5
-    
+
     # Target parameters
     outer_r = size / 2 - 8
     inner_r = outer_r * 0.42
     ring_width = 2.0
     center_r = 2.5
     crosshair_width = 1.8
-    
-    def target_coverage(x: float, y: float) -> float:
-        dist = distance(x, y, cx, cy)
-        coverage = 0.0
-        
+
+    # Derived constants; divisions become multiplies by reciprocals
+    inv_outer_ring = 1.0 / (ring_width * 0.5)
+    inv_inner_ring = 1.0 / (ring_width * 0.35)
+    center_falloff = 0.7 / center_r
+    inv_crosshair = 1.0 / crosshair_width
+    gap_inner = inner_r + ring_width + 1
+    gap_outer = outer_r - ring_width - 1
+    extent = outer_r + ring_width * 0.5
+
+    def target_coverage(x: np.ndarray, y: np.ndarray, dist: np.ndarray) -> np.ndarray:
+        coverage = np.zeros_like(dist)
+
         # Outer ring
-        outer_dist = abs(dist - outer_r)
-        if outer_dist < ring_width:
-            coverage = max(coverage, clamp(1.0 - outer_dist / (ring_width * 0.5)))
-        
+        outer_dist = np.abs(dist - outer_r)
+        coverage = np.maximum(coverage, clamp(1.0 - outer_dist * inv_outer_ring))
+
         # Inner ring
-        inner_dist = abs(dist - inner_r)
-        if inner_dist < ring_width * 0.7:
-            coverage = max(coverage, clamp(1.0 - inner_dist / (ring_width * 0.35)))
-        
+        inner_dist = np.abs(dist - inner_r)
+        coverage = np.maximum(coverage, clamp(1.0 - inner_dist * inv_inner_ring))
+
         # Center dot
-        if dist < center_r:
-            coverage = max(coverage, clamp(1.0 - dist / center_r * 0.7))
-        
+        coverage = np.where(dist < center_r,
+                            np.maximum(coverage, clamp(1.0 - dist * center_falloff)),
+                            coverage)
+
         # Crosshairs (only between rings)
-        gap_inner = inner_r + ring_width + 1
-        gap_outer = outer_r - ring_width - 1
-        
+        between = (gap_inner < dist) & (dist < gap_outer)
+
         # Vertical crosshair
-        if gap_inner < dist < gap_outer:
-            x_dist = abs(x - cx)
-            if x_dist < crosshair_width:
-                coverage = max(coverage, clamp(1.0 - x_dist / crosshair_width))
-            
-            # Horizontal crosshair
-            y_dist = abs(y - cy)
-            if y_dist < crosshair_width:
-                coverage = max(coverage, clamp(1.0 - y_dist / crosshair_width))
-        
+        x_dist = np.abs(x - cx)
+        coverage = np.where(between,
+                            np.maximum(coverage, clamp(1.0 - x_dist * inv_crosshair)),
+                            coverage)
+
+        # Horizontal crosshair
+        y_dist = np.abs(y - cy)
+        coverage = np.where(between,
+                            np.maximum(coverage, clamp(1.0 - y_dist * inv_crosshair)),
+                            coverage)
+
         return coverage
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, target_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.92)
-
-def draw_play_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+
+    bbox = (cx - extent, cy - extent, cx + extent, cy + extent)
+    return sample_pixel_aa(size, target_coverage, bbox, polar_grid(size, cx, cy)[:1]) * 0.92
+
+def draw_play_symbol(size: int) -> np.ndarray:
     """Draw a crisp play triangle symbol."""
     cx = cy = size / 2 - 0.5
-    
+
     # Triangle parameters - slightly offset right for visual balance
     offset = 1.5
     scale = 0.42
-    
+
     # Triangle vertices (pointing right)
     left_x = cx - size * scale * 0.35 + offset
     right_x = cx + size * scale * 0.45 + offset
     top_y = cy - size * scale * 0.4
     bottom_y = cy + size * scale * 0.4
-    
-    def point_in_triangle(px: float, py: float, 
-                          x1: float, y1: float, 
-                          x2: float, y2: float, 
-                          x3: float, y3: float) -> float:
-        """Check if point is in triangle, return signed distance for AA."""
-        def sign(p1x, p1y, p2x, p2y, p3x, p3y):
-            return (p1x - p3x) * (p2y - p3y) - (p2x - p3x) * (p1y - p3y)
-        
-        d1 = sign(px, py, x1, y1, x2, y2)
-        d2 = sign(px, py, x2, y2, x3, y3)
-        d3 = sign(px, py, x3, y3, x1, y1)
-        
-        has_neg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-        has_pos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-        
-        inside = not (has_neg and has_pos)
-        
-        if inside:
-            # Calculate distance to nearest edge for anti-aliasing
-            def point_to_line_dist(px, py, x1, y1, x2, y2):
-                dx, dy = x2 - x1, y2 - y1
-                length = math.sqrt(dx * dx + dy * dy)
-                if length < 0.001:
-                    return distance(px, py, x1, y1)
-                return abs(dy * px - dx * py + x2 * y1 - y2 * x1) / length
-            
-            d_to_edge = min(
-                point_to_line_dist(px, py, x1, y1, x2, y2),
-                point_to_line_dist(px, py, x2, y2, x3, y3),
-                point_to_line_dist(px, py, x3, y3, x1, y1)
-            )
-            return clamp(d_to_edge + 0.5)
-        return 0.0
-    
-    def play_coverage(x: float, y: float) -> float:
-        return point_in_triangle(x, y, 
-                                  left_x, top_y,
-                                  left_x, bottom_y,
-                                  right_x, cy)
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, play_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.95)
-
-def draw_terminal_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+
+    vertices = [(left_x, top_y), (left_x, bottom_y), (right_x, cy)]
+    centroid_x = sum(vx for vx, _ in vertices) / 3
+    centroid_y = sum(vy for _, vy in vertices) / 3
+
+    # Unit normal (nx, ny) and offset c per edge, oriented so that
+    # nx * px + ny * py - c is the signed distance to the edge,
+    # positive inside the triangle
+    edges = []
+    for (x1, y1), (x2, y2) in zip(vertices, vertices[1:] + vertices[:1]):
+        length = math.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+        nx, ny = (y2 - y1) / length, -(x2 - x1) / length
+        c = nx * x1 + ny * y1
+        if nx * centroid_x + ny * centroid_y - c < 0:
+            nx, ny, c = -nx, -ny, -c
+        edges.append((nx, ny, c))
+
+    def play_coverage(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        sd = [nx * x + ny * y - c for nx, ny, c in edges]
+
+        # Smallest signed distance: distance to the nearest edge inside,
+        # negative outside, so one clamp covers inside/outside and AA
+        d_to_edge = np.minimum(np.minimum(sd[0], sd[1]), sd[2])
+        return clamp(d_to_edge + 0.5)
+
+    # Coverage is nonzero out to each edge pushed 0.5 px outward; that
+    # offset triangle's corners sit 0.5 / sin(half the interior angle)
+    # from the original vertices, so pad each vertex by that much
+    pads = []
+    for i, (vx, vy) in enumerate(vertices):
+        (ax, ay), (bx, by) = vertices[i - 1], vertices[(i + 1) % 3]
+        interior = abs(math.atan2(ay - vy, ax - vx) - math.atan2(by - vy, bx - vx))
+        interior = min(interior, 2 * math.pi - interior)
+        pads.append(0.5 / math.sin(interior / 2))
+    bbox = (min(vx - p for (vx, _), p in zip(vertices, pads)),
+            min(vy - p for (_, vy), p in zip(vertices, pads)),
+            max(vx + p for (vx, _), p in zip(vertices, pads)),
+            max(vy + p for (_, vy), p in zip(vertices, pads)))
+    return sample_pixel_aa(size, play_coverage, bbox) * 0.95
+
+def draw_terminal_symbol(size: int) -> np.ndarray:
     """Draw a crisp terminal/console symbol (>_ prompt)."""
     cx = cy = size / 2 - 0.5
-    
+
     # Symbol parameters
     line_width = 2.2
     chevron_size = 6.5
@@ -317,50 +387,57 @@ def draw_terminal_symbol(pixels: List[int], size: int, fg_color: int) -> None:
     underscore_y = cy + 6
     underscore_x = cx + 1
     underscore_len = 9
-    
-    def terminal_coverage(x: float, y: float) -> float:
-        coverage = 0.0
-        
+
+    # Derived constants
+    inv_line_width = 1.0 / line_width
+    underscore_half_w = line_width * 0.9
+    inv_underscore_half_w = 1.0 / underscore_half_w
+    underscore_end = underscore_x + underscore_len
+    bbox = (chevron_x - line_width, chevron_y - chevron_size,
+            max(chevron_x + chevron_size + line_width, underscore_end),
+            max(chevron_y + chevron_size, underscore_y + underscore_half_w))
+
+    def terminal_coverage(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        coverage = np.zeros(np.broadcast(x, y).shape)
+
         # Chevron > symbol
         # Upper arm
-        if y >= chevron_y - chevron_size and y <= chevron_y:
-            expected_x = chevron_x + (chevron_y - y)
-            dist_to_line = abs(x - expected_x)
-            if dist_to_line < line_width:
-                coverage = max(coverage, clamp(1.0 - dist_to_line / line_width))
-        
+        expected_x = chevron_x + (chevron_y - y)
+        dist_to_line = np.abs(x - expected_x)
+        upper = (y >= chevron_y - chevron_size) & (y <= chevron_y)
+        coverage = np.where(upper,
+                            np.maximum(coverage, clamp(1.0 - dist_to_line * inv_line_width)),
+                            coverage)
+
         # Lower arm
-        if y >= chevron_y and y <= chevron_y + chevron_size:
-            expected_x = chevron_x + (y - chevron_y)
-            dist_to_line = abs(x - expected_x)
-            if dist_to_line < line_width:
-                coverage = max(coverage, clamp(1.0 - dist_to_line / line_width))
-        
+        expected_x = chevron_x + (y - chevron_y)
+        dist_to_line = np.abs(x - expected_x)
+        lower = (y >= chevron_y) & (y <= chevron_y + chevron_size)
+        coverage = np.where(lower,
+                            np.maximum(coverage, clamp(1.0 - dist_to_line * inv_line_width)),
+                            coverage)
+
         # Underscore _
-        if underscore_x <= x <= underscore_x + underscore_len:
-            dist_to_line = abs(y - underscore_y)
-            if dist_to_line < line_width * 0.9:
-                # Horizontal edges
-                h_factor = 1.0
-                if x < underscore_x + 1:
-                    h_factor = clamp(x - underscore_x + 0.5)
-                elif x > underscore_x + underscore_len - 1:
-                    h_factor = clamp(underscore_x + underscore_len - x + 0.5)
-                coverage = max(coverage, clamp(1.0 - dist_to_line / (line_width * 0.9)) * h_factor)
-        
+        dist_to_line = np.abs(y - underscore_y)
+        underscore = ((underscore_x <= x) & (x <= underscore_end)
+                      & (dist_to_line < underscore_half_w))
+        # Horizontal edges
+        h_factor = np.where(x < underscore_x + 1, clamp(x - underscore_x + 0.5),
+                            np.where(x > underscore_end - 1,
+                                     clamp(underscore_end - x + 0.5), 1.0))
+        coverage = np.where(underscore,
+                            np.maximum(coverage,
+                                       clamp(1.0 - dist_to_line * inv_underscore_half_w) * h_factor),
+                            coverage)
+
         return coverage
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, terminal_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.92)
-
-def draw_brightness_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+
+    return sample_pixel_aa(size, terminal_coverage, bbox) * 0.92
+
+def draw_brightness_symbol(size: int) -> np.ndarray:
     """Draw a crisp sun/brightness symbol."""
     cx = cy = size / 2 - 0.5
-    
+
     # Sun parameters
     sun_r = 5.0
     ray_inner = sun_r + 3.0
@@ -368,163 +445,138 @@ def draw_brightness_symbol(pixels: List[int], size: int, fg_color: int) -> None:
     num_rays = 8
     ray_width = 0.28  # Radians - width of each ray
     ray_thickness = 2.0  # Pixel width of ray
-    
-    def brightness_coverage(x: float, y: float) -> float:
-        dist = distance(x, y, cx, cy)
-        coverage = 0.0
-        
+
+    # Derived constants; divisions become multiplies by reciprocals
+    ray_angle = (2 * math.pi) / num_rays
+    inv_ray_angle = num_rays / (2 * math.pi)
+    inv_ray_width = 1.0 / (ray_width * 0.6)
+    inv_ray_thickness = 1.0 / ray_thickness
+    extent = max(sun_r, ray_outer) + 0.5
+
+    def brightness_coverage(x: np.ndarray, y: np.ndarray,
+                            dist: np.ndarray, angle: np.ndarray) -> np.ndarray:
         # Sun center circle
-        if dist < sun_r + 0.5:
-            if dist <= sun_r - 0.5:
-                coverage = 1.0
-            else:
-                coverage = clamp(sun_r + 0.5 - dist)
-        
+        coverage = clamp(sun_r + 0.5 - dist)
+
         # Sun rays
-        if ray_inner - 0.5 <= dist <= ray_outer + 0.5:
-            angle = math.atan2(y - cy, x - cx)
-            ray_angle = (2 * math.pi) / num_rays
-            
-            # Find distance to nearest ray center
-            normalized = ((angle % ray_angle) + ray_angle) % ray_angle
-            dist_to_ray_center = min(normalized, ray_angle - normalized)
-            
-            if dist_to_ray_center < ray_width:
-                # Ray angular coverage
-                angular_factor = clamp(1.0 - dist_to_ray_center / (ray_width * 0.6))
-                
-                # Ray radial coverage (tapered ends)
-                if dist < ray_inner + 1:
-                    radial_factor = clamp(dist - ray_inner + 0.5)
-                elif dist > ray_outer - 1:
-                    radial_factor = clamp(ray_outer + 0.5 - dist)
-                else:
-                    radial_factor = 1.0
-                
-                # Ray thickness
-                perp_dist = dist * math.sin(dist_to_ray_center)
-                thickness_factor = clamp(1.0 - perp_dist / ray_thickness)
-                
-                ray_coverage = angular_factor * radial_factor * thickness_factor
-                coverage = max(coverage, ray_coverage)
-        
-        return coverage
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, brightness_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.93)
-
-def draw_wifi_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+        # Find distance to nearest ray center
+        normalized = angle - ray_angle * np.floor(angle * inv_ray_angle)
+        dist_to_ray_center = np.minimum(normalized, ray_angle - normalized)
+
+        # Ray angular coverage
+        angular_factor = clamp(1.0 - dist_to_ray_center * inv_ray_width)
+
+        # Ray radial coverage (tapered ends)
+        radial_factor = np.where(dist < ray_inner + 1, clamp(dist - ray_inner + 0.5),
+                                 np.where(dist > ray_outer - 1, clamp(ray_outer + 0.5 - dist), 1.0))
+
+        # Ray thickness
+        perp_dist = dist * np.sin(dist_to_ray_center)
+        thickness_factor = clamp(1.0 - perp_dist * inv_ray_thickness)
+
+        ray_coverage = angular_factor * radial_factor * thickness_factor
+        on_ray = ((ray_inner - 0.5 <= dist) & (dist <= ray_outer + 0.5)
+                  & (dist_to_ray_center < ray_width))
+        return np.where(on_ray, np.maximum(coverage, ray_coverage), coverage)
+
+    bbox = (cx - extent, cy - extent, cx + extent, cy + extent)
+    return sample_pixel_aa(size, brightness_coverage, bbox, polar_grid(size, cx, cy)) * 0.93
+
+def draw_wifi_symbol(size: int) -> np.ndarray:
     """Draw crisp WiFi signal arcs symbol."""
     cx = size / 2 - 0.5
     cy = size / 2 + 4  # Shifted down
-    
+
     # Arc parameters
     radii = [6.5, 11.0, 15.5]  # Arc radii
     arc_width = 2.2
     dot_r = 2.8
     arc_angle = math.pi * 0.75  # 135 degrees total arc
-    
-    def wifi_coverage(x: float, y: float) -> float:
-        dist = distance(x, y, cx, cy)
-        coverage = 0.0
-        
+    dot_cy = cy + 1
+    dot_inner_sq = (dot_r - 0.5) ** 2
+    dot_outer_sq = (dot_r + 0.5) ** 2
+    half_arc = arc_angle / 2
+    inv_fade_width = 1.0 / 0.2  # Angular fade over the last 0.2 rad
+    ring_factor_scale = 1.0 / (arc_width * 0.55)
+    extent = max(radii) + arc_width * 0.55
+    bbox = (cx - extent, cy - extent, cx + extent, dot_cy + dot_r + 0.5)
+
+    def wifi_coverage(x: np.ndarray, y: np.ndarray,
+                      dist: np.ndarray, angle: np.ndarray) -> np.ndarray:
+        coverage = np.zeros_like(dist)
+
         # Check angle - only draw upper portion (arcs face up)
-        angle = math.atan2(y - cy, x - cx)
-        angle_from_up = abs(angle + math.pi / 2)  # Distance from -90 degrees (up)
-        
-        if angle_from_up < arc_angle / 2:
-            for r in radii:
-                ring_dist = abs(dist - r)
-                if ring_dist < arc_width:
-                    # Ring coverage
-                    ring_factor = clamp(1.0 - ring_dist / (arc_width * 0.55))
-                    
-                    # Angular fade at ends
-                    angle_edge = arc_angle / 2 - abs(angle_from_up)
-                    if angle_edge < 0.2:
-                        ring_factor *= clamp(angle_edge / 0.2)
-                    
-                    coverage = max(coverage, ring_factor)
-        
+        angle_from_up = np.abs(angle + math.pi / 2)  # Distance from -90 degrees (up)
+
+        # Angular fade at ends (0.0 outside the arc)
+        angle_edge = half_arc - angle_from_up
+        fade = clamp(angle_edge * inv_fade_width)
+
+        for r in radii:
+            ring_dist = np.abs(dist - r)
+            # Ring coverage
+            ring_factor = clamp(1.0 - ring_dist * ring_factor_scale) * fade
+            coverage = np.maximum(coverage, ring_factor)
+
         # Bottom dot
-        dot_cy = cy + 1
-        dot_dist = distance(x, y, cx, dot_cy)
-        if dot_dist < dot_r + 0.5:
-            if dot_dist <= dot_r - 0.5:
-                coverage = max(coverage, 1.0)
-            else:
-                coverage = max(coverage, clamp(dot_r + 0.5 - dot_dist))
-        
-        return coverage
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, wifi_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.92)
-
-def draw_more_symbol(pixels: List[int], size: int, fg_color: int) -> None:
+        dot_dist_sq = distance_sq(x, y, cx, dot_cy)
+        return np.maximum(coverage, disc_coverage(dot_dist_sq, dot_r, dot_inner_sq, dot_outer_sq))
+
+    return sample_pixel_aa(size, wifi_coverage, bbox, polar_grid(size, cx, cy)) * 0.92
+
+def draw_more_symbol(size: int) -> np.ndarray:
     """Draw three dots (more/menu) symbol."""
     cx = size / 2 - 0.5
     cy = size / 2 - 0.5
     dot_r = 3.2
+    dot_inner_sq = (dot_r - 0.5) ** 2
+    dot_outer_sq = (dot_r + 0.5) ** 2
     spacing = 10
-    
+
     dot_positions = [
         (cx - spacing, cy),
         (cx, cy),
         (cx + spacing, cy),
     ]
-    
-    def more_coverage(x: float, y: float) -> float:
-        coverage = 0.0
+    extent = dot_r + 0.5
+    bbox = (cx - spacing - extent, cy - extent, cx + spacing + extent, cy + extent)
+
+    def more_coverage(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        coverage = np.zeros(np.broadcast(x, y).shape)
         for dx, dy in dot_positions:
-            dist = distance(x, y, dx, dy)
-            if dist < dot_r + 0.5:
-                if dist <= dot_r - 0.5:
-                    coverage = max(coverage, 1.0)
-                else:
-                    coverage = max(coverage, clamp(dot_r + 0.5 - dist))
+            dist_sq = distance_sq(x, y, dx, dy)
+            coverage = np.maximum(coverage,
+                                  disc_coverage(dist_sq, dot_r, dot_inner_sq, dot_outer_sq))
         return coverage
-    
-    for y in range(size):
-        for x in range(size):
-            coverage = sample_pixel_aa(x, y, size, more_coverage)
-            if coverage > 0.01:
-                idx = y * size + x
-                pixels[idx] = blend_565(fg_color, pixels[idx], coverage * 0.93)
-
-def generate_icon(icon_def: IconDef, transparent: int = 0x0000) -> List[int]:
+
+    return sample_pixel_aa(size, more_coverage, bbox) * 0.93
+
+# Symbol name -> draw function returning the symbol's alpha map
+SYMBOL_DISPATCH = {
+    'gear': draw_gear_symbol,
+    'target': draw_target_symbol,
+    'play': draw_play_symbol,
+    'terminal': draw_terminal_symbol,
+    'brightness': draw_brightness_symbol,
+    'wifi': draw_wifi_symbol,
+    'more': draw_more_symbol,
+}
+
+def generate_icon(icon_def: IconDef, transparent: int = 0x0000) -> np.ndarray:
     """Generate a complete icon with background and symbol."""
-    # Create circular background
-    pixels = generate_circle_background(ICON_SIZE, icon_def.bg_color, transparent)
-    
     # Draw symbol based on type
     symbol_color = 0xFFFF  # White symbols
     
-    if icon_def.symbol == 'gear':
-        draw_gear_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'target':
-        draw_target_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'play':
-        draw_play_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'terminal':
-        draw_terminal_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'brightness':
-        draw_brightness_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'wifi':
-        draw_wifi_symbol(pixels, ICON_SIZE, symbol_color)
-    elif icon_def.symbol == 'more':
-        draw_more_symbol(pixels, ICON_SIZE, symbol_color)
+    draw_symbol = SYMBOL_DISPATCH.get(icon_def.symbol)
+    if draw_symbol is not None:
+        symbol_alpha = draw_symbol(ICON_SIZE)
+    else:
+        symbol_alpha = np.zeros((ICON_SIZE, ICON_SIZE))
     
-    return pixels
+    # Background and symbol composited together
+    return rasterize_icon(ICON_SIZE, icon_def.bg_color, symbol_alpha, symbol_color, transparent)
 
-def format_pixel_array(name: str, pixels: List[int], width: int) -> str:
+def format_pixel_array(name: str, pixels: np.ndarray, width: int) -> str:
     """Format pixel data as C++ array."""
     lines = []
     lines.append(f"static constexpr int kCircularIcon_{name}_W = {ICON_SIZE};")
@@ -532,11 +584,10 @@ def format_pixel_array(name: str, pixels: List[int], width: int) -> str:
     lines.append(f"static constexpr uint16_t kCircularIcon_{name}_Color = 0x0000;")
     lines.append(f"static const uint16_t kCircularIcon_{name}[{len(pixels)}] = {{")
     
-    for i in range(0, len(pixels), 16):
-        row = pixels[i:i+16]
-        hex_values = [f"0x{p:04X}" for p in row]
-        line = "  " + ", ".join(hex_values) + ","
-        lines.append(line)
+    # Format every value in C, then join 16 per row
+    hex_values = np.char.mod("0x%04X", pixels).tolist()
+    for i in range(0, len(hex_values), 16):
+        lines.append("  " + ", ".join(hex_values[i:i+16]) + ",")
     
     lines.append("};")
     return "\n".join(lines)
@@ -553,40 +604,49 @@ def main():
         IconDef("more", ICON_COLORS['gray'], "more"),
     ]
     
-    # Generate header file
-    print("#pragma once")
-    print()
-    print("// Auto-generated circular icons for M5Dial launcher UI")
-    print("// Style: 42x42 with colored circular backgrounds")
-    print("// High-quality with 4x4 multi-sample anti-aliasing")
-    print("// Generated by tools/generate_circular_icons.py")
-    print()
-    print("#include <cstdint>")
-    print()
-    print("namespace ui::assets {")
-    print()
-    print("// Icon dimensions")
-    print(f"static constexpr int kCircularIconSize = {ICON_SIZE};")
-    print(f"static constexpr int kCircularIconRadius = {ICON_RADIUS};")
-    print(f"static constexpr uint16_t kCircularIconTransparent = 0x0000;")
-    print()
+    # Each icon is a pure function of its IconDef. Generation takes a few
+    # milliseconds in total, so it runs serially: a process pool would
+    # spend longer starting workers than rasterizing.
+    all_pixels = [generate_icon(icon_def) for icon_def in icons]
+    
+    # Build the whole header in memory and write it out in one go
+    buf = io.StringIO()
+    emit = functools.partial(print, file=buf)
+    
+    emit("#pragma once")
+    emit()
+    emit("// Auto-generated circular icons for M5Dial launcher UI")
+    emit("// Style: 42x42 with colored circular backgrounds")
+    emit("// High-quality with 4x4 multi-sample anti-aliasing")
+    emit("// Generated by tools/generate_circular_icons.py")
+    emit()
+    emit("#include <cstdint>")
+    emit()
+    emit("namespace ui::assets {")
+    emit()
+    emit("// Icon dimensions")
+    emit(f"static constexpr int kCircularIconSize = {ICON_SIZE};")
+    emit(f"static constexpr int kCircularIconRadius = {ICON_RADIUS};")
+    emit(f"static constexpr uint16_t kCircularIconTransparent = 0x0000;")
+    emit()
     
     # Print color palette
-    print("// Icon background colors (RGB565)")
-    print("struct CircularIconColors {")
+    emit("// Icon background colors (RGB565)")
+    emit("struct CircularIconColors {")
     for name, color in ICON_COLORS.items():
-        print(f"    static constexpr uint16_t {name} = 0x{color:04X};")
-    print("};")
-    print()
+        emit(f"    static constexpr uint16_t {name} = 0x{color:04X};")
+    emit("};")
+    emit()
+    
+    # Emit each icon
+    for icon_def, pixels in zip(icons, all_pixels):
+        emit(format_pixel_array(icon_def.name, pixels, ICON_SIZE))
+        emit()
     
-    # Generate each icon
-    for icon_def in icons:
-        pixels = generate_icon(icon_def)
-        print(format_pixel_array(icon_def.name, pixels, ICON_SIZE))
-        print()
+    emit("} // namespace ui::assets")
+    emit()
     
-    print("} // namespace ui::assets")
-    print()
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Generate polished RGB565 icon assets for the M5Dial UI.
 
-No external dependencies (no Pillow). Icons are geometric rasterizations
+Requires NumPy (no Pillow). Icons are geometric rasterizations
 with anti-aliasing, gradients, and stylized designs.
 
 Output: main/ui/assets/menu_icons.hpp
@@ -9,78 +9,103 @@ Output: main/ui/assets/menu_icons.hpp
 
 from __future__ import annotations
 
+import functools
+import io
 import math
-from dataclasses import dataclass
 from pathlib import Path
+from typing import NamedTuple, Sequence
 
+import numpy as np
 
-@dataclass(frozen=True)
-class Color:
+
+class Color(NamedTuple):
     r: int
     g: int
     b: int
 
-    def clamp(self) -> "Color":
-        return Color(
-            max(0, min(255, self.r)),
-            max(0, min(255, self.g)),
-            max(0, min(255, self.b)),
-        )
-
     def to_rgb565(self) -> int:
-        c = self.clamp()
-        r5 = (c.r * 31 + 127) // 255
-        g6 = (c.g * 63 + 127) // 255
-        b5 = (c.b * 31 + 127) // 255
+        r5 = (self.r * 31 + 127) // 255
+        g6 = (self.g * 63 + 127) // 255
+        b5 = (self.b * 31 + 127) // 255
         return (r5 << 11) | (g6 << 5) | b5
 
     def lerp(self, other: "Color", t: float) -> "Color":
-        """Linear interpolation between colors."""
-        t = max(0.0, min(1.0, t))
+        """Linear interpolation between colors (8.8 fixed point, stays in 0..255)."""
+        ti = max(0, min(256, int(t * 256)))
         return Color(
-            int(self.r + (other.r - self.r) * t),
-            int(self.g + (other.g - self.g) * t),
-            int(self.b + (other.b - self.b) * t),
+            (self.r * (256 - ti) + other.r * ti) >> 8,
+            (self.g * (256 - ti) + other.g * ti) >> 8,
+            (self.b * (256 - ti) + other.b * ti) >> 8,
         )
 
 
-def blend_over(dst: Color, src: Color, alpha: float) -> Color:
-    """Alpha-blend src over dst."""
-    a = max(0.0, min(1.0, alpha))
-    inv = 1.0 - a
-    return Color(
-        int(dst.r * inv + src.r * a),
-        int(dst.g * inv + src.g * a),
-        int(dst.b * inv + src.b * a),
-    )
+# Every menu icon is rendered at this size
+CANVAS_SIZE = 64
+
+# Shared pixel coordinate grids (rows, columns) for CANVAS_SIZE canvases
+CANVAS_YY, CANVAS_XX = np.ogrid[0:CANVAS_SIZE, 0:CANVAS_SIZE]
+
+# RGB565 field for every 8-bit channel value, already shifted into place
+_R5 = ((np.arange(256, dtype=np.uint16) * 31 + 127) // 255) << 11
+_G6 = ((np.arange(256, dtype=np.uint16) * 63 + 127) // 255) << 5
+_B5 = (np.arange(256, dtype=np.uint16) * 31 + 127) // 255
+
+
+def blend_over(dst: int | np.ndarray, src: int | np.ndarray, alpha: float | np.ndarray) -> np.ndarray:
+    """Alpha-blend src over dst for one channel (scalars or uint8 planes).
+
+    Alpha is quantized to 0..256 so the mix is (dst*(256-a) + src*a) >> 8
+    in integers; a = 256 reproduces src exactly.
+    """
+    a = (np.clip(alpha, 0.0, 1.0) * 256).astype(np.uint16)
+    return ((dst * (256 - a) + src * a) >> 8).astype(np.uint8)
 
 
 class Canvas:
+    """RGB888 canvas stored as three planar (h, w) uint8 channel buffers."""
+
     def __init__(self, w: int, h: int, bg: Color) -> None:
         self.w = w
         self.h = h
         self.bg = bg
-        self.px = [bg for _ in range(w * h)]
-
-    def _idx(self, x: int, y: int) -> int:
-        return y * self.w + x
+        self.r = np.full((h, w), bg.r, np.uint8)
+        self.g = np.full((h, w), bg.g, np.uint8)
+        self.b = np.full((h, w), bg.b, np.uint8)
+        # Pixel coordinate grids shared by every vectorized primitive
+        if w == h == CANVAS_SIZE:
+            self.YY, self.XX = CANVAS_YY, CANVAS_XX
+        else:
+            self.YY, self.XX = np.ogrid[0:h, 0:w]
 
     def set(self, x: int, y: int, c: Color) -> None:
         if 0 <= x < self.w and 0 <= y < self.h:
-            self.px[self._idx(x, y)] = c
+            self.r[y, x] = c.r
+            self.g[y, x] = c.g
+            self.b[y, x] = c.b
 
-    def get(self, x: int, y: int) -> Color:
+    def get(self, x: int, y: int) -> tuple[int, int, int]:
         if 0 <= x < self.w and 0 <= y < self.h:
-            return self.px[self._idx(x, y)]
-        return self.bg
+            return int(self.r[y, x]), int(self.g[y, x]), int(self.b[y, x])
+        return self.bg.r, self.bg.g, self.bg.b
 
     def seta(self, x: int, y: int, c: Color, a: float) -> None:
         if 0 <= x < self.w and 0 <= y < self.h:
-            idx = self._idx(x, y)
-            self.px[idx] = blend_over(self.px[idx], c, a)
+            self.r[y, x] = blend_over(self.r[y, x], c.r, a)
+            self.g[y, x] = blend_over(self.g[y, x], c.g, a)
+            self.b[y, x] = blend_over(self.b[y, x], c.b, a)
+
+    def to_rgb565(self) -> np.ndarray:
+        """Convert the whole canvas to a (h, w) uint16 RGB565 array."""
+        return _R5[self.r] | _G6[self.g] | _B5[self.b]
 
     def line_aa(self, x0: float, y0: float, x1: float, y1: float, c: Color, width: float = 1.0) -> None:
-        """Anti-aliased line with variable thickness."""
+        """Anti-aliased line with variable thickness and round caps.
+
+        The line is a chain of AA discs every half pixel, all rasterized at
+        once over the line's bounding box. Their coverage accumulates as
+        1 - prod(1 - a_i), exactly what blending them one by one builds up,
+        so soft edges keep their full stroke weight.
+        """
         dx = x1 - x0
         dy = y1 - y0
         dist = math.sqrt(dx * dx + dy * dy)
@@ -89,19 +114,15 @@ class Canvas:
         
         steps = int(dist * 2) + 1
         hw = width / 2.0
+        tt = np.linspace(0.0, 1.0, steps + 1)
+        pxs = (x0 + dx * tt)[:, None, None]
+        pys = (y0 + dy * tt)[:, None, None]
         
-        for i in range(steps + 1):
-            t = i / steps
-            px = x0 + dx * t
-            py = y0 + dy * t
-            
-            # Draw anti-aliased disc at each point
-            for iy in range(int(py - hw - 1), int(py + hw + 2)):
-                for ix in range(int(px - hw - 1), int(px + hw + 2)):
-                    d = math.sqrt((ix - px) ** 2 + (iy - py) ** 2)
-                    if d <= hw + 1:
-                        a = max(0.0, min(1.0, hw + 1 - d))
-                        self.seta(ix, iy, c, a)
+        ya, yb = max(0, int(min(y0, y1) - hw - 1)), min(self.h, int(max(y0, y1) + hw + 2))
+        xa, xb = max(0, int(min(x0, x1) - hw - 1)), min(self.w, int(max(x0, x1) + hw + 2))
+        d = np.sqrt((self.XX[:, xa:xb] - pxs) ** 2 + (self.YY[ya:yb] - pys) ** 2)
+        a = 1.0 - np.prod(1.0 - np.clip(hw + 1 - d, 0.0, 1.0), axis=0)
+        self._blend((slice(ya, yb), slice(xa, xb)), *c, a)
 
     def line(self, x0: int, y0: int, x1: int, y1: int, c: Color) -> None:
         # Bresenham
@@ -139,56 +160,101 @@ class Canvas:
                 err += 1 - 2 * x
 
     def fill_circle(self, cx: int, cy: int, r: int, c: Color) -> None:
-        rr = r * r
-        for y in range(cy - r, cy + r + 1):
-            dy = y - cy
-            dy2 = dy * dy
-            if dy2 > rr:
-                continue
-            dx = int(math.sqrt(rr - dy2))
-            x0 = cx - dx
-            x1 = cx + dx
-            for x in range(x0, x1 + 1):
-                self.set(x, y, c)
+        m = (self.XX - cx) ** 2 + (self.YY - cy) ** 2 <= r * r
+        self.r[m] = c.r
+        self.g[m] = c.g
+        self.b[m] = c.b
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, c: Color) -> None:
+        """Solid rectangle covering [x0, x1) x [y0, y1), clipped to the canvas."""
+        region = (slice(max(0, y0), max(0, y1)), slice(max(0, x0), max(0, x1)))
+        self.r[region] = c.r
+        self.g[region] = c.g
+        self.b[region] = c.b
+
+    def _disc_dist2(self, cx: float, cy: float, r: float) -> tuple[np.ndarray, tuple[slice, slice]]:
+        """Squared distance to (cx, cy) over a radius-r disc's AA bounding box, clipped to the canvas."""
+        y0, y1 = max(0, int(cy - r - 2)), min(self.h, int(cy + r + 3))
+        x0, x1 = max(0, int(cx - r - 2)), min(self.w, int(cx + r + 3))
+        d2 = (self.XX[:, x0:x1] - cx) ** 2 + (self.YY[y0:y1] - cy) ** 2
+        return d2, (slice(y0, y1), slice(x0, x1))
+
+    def _disc_dist(self, cx: float, cy: float, r: float) -> tuple[np.ndarray, tuple[slice, slice]]:
+        """Distance to (cx, cy) over a radius-r disc's AA bounding box, clipped to the canvas."""
+        d2, region = self._disc_dist2(cx, cy, r)
+        return np.sqrt(d2), region
+
+    def _blend(
+        self,
+        region: tuple[slice, slice],
+        r: int | np.ndarray,
+        g: int | np.ndarray,
+        b: int | np.ndarray,
+        alpha: np.ndarray,
+    ) -> None:
+        """Blend a color (scalar or per-pixel channels) into region with alpha."""
+        self.r[region] = blend_over(self.r[region], r, alpha)
+        self.g[region] = blend_over(self.g[region], g, alpha)
+        self.b[region] = blend_over(self.b[region], b, alpha)
+
+    def fill_alpha(self, region: tuple[slice, slice], c: Color, alpha: np.ndarray) -> None:
+        """Blend a solid color into region (y slice, x slice) with a per-pixel alpha map."""
+        self._blend(region, *c, alpha)
 
     def fill_circle_aa(self, cx: float, cy: float, r: float, c: Color) -> None:
         """Anti-aliased filled circle."""
-        for y in range(int(cy - r - 2), int(cy + r + 3)):
-            for x in range(int(cx - r - 2), int(cx + r + 3)):
-                d = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-                if d <= r - 0.5:
-                    self.set(x, y, c)
-                elif d <= r + 0.5:
-                    a = r + 0.5 - d
-                    self.seta(x, y, c, a)
+        d2, region = self._disc_dist2(cx, cy, r)
+        # Fully covered core and empty outside need no sqrt; only the 1 px edge does
+        core = d2 < max(r - 0.5, 0.0) ** 2
+        edge = ~core & (d2 < (r + 0.5) ** 2)
+        a = core.astype(float)
+        a[edge] = r + 0.5 - np.sqrt(d2[edge])
+        self._blend(region, *c, a)
+
+    def fill_circles_aa(
+        self,
+        cxs: np.ndarray,
+        cys: np.ndarray,
+        r: float | np.ndarray,
+        colors: Color | Sequence[Color],
+    ) -> None:
+        """Anti-aliased filled circles rasterized in one batched pass.
+
+        Coverage accumulates as 1 - prod(1 - a_i), as sequential over-blending
+        would; each pixel takes the color of the disc covering it most (later
+        discs win ties).
+        """
+        cxs = np.asarray(cxs, dtype=float)
+        cys = np.asarray(cys, dtype=float)
+        if len(cxs) == 0:
+            return
+        r = np.broadcast_to(np.asarray(r, dtype=float), cxs.shape)
+        rgb = np.broadcast_to(np.asarray(colors).reshape(-1, 3), (len(cxs), 3))
+        pad = float(r.max())
+        y0, y1 = max(0, int(cys.min() - pad - 2)), min(self.h, int(cys.max() + pad + 3))
+        x0, x1 = max(0, int(cxs.min() - pad - 2)), min(self.w, int(cxs.max() + pad + 3))
+        d2 = (self.XX[None, :, x0:x1] - cxs[:, None, None]) ** 2 + (self.YY[None, y0:y1] - cys[:, None, None]) ** 2
+        a = np.clip(r[:, None, None] + 0.5 - np.sqrt(d2), 0.0, 1.0)
+        top = len(cxs) - 1 - np.argmax(a[::-1], axis=0)
+        alpha = 1.0 - np.prod(1.0 - a, axis=0)
+        self._blend((slice(y0, y1), slice(x0, x1)), *rgb[top].transpose(2, 0, 1), alpha)
 
     def fill_circle_gradient(self, cx: float, cy: float, r: float, c_inner: Color, c_outer: Color) -> None:
         """Gradient-filled anti-aliased circle."""
-        for y in range(int(cy - r - 2), int(cy + r + 3)):
-            for x in range(int(cx - r - 2), int(cx + r + 3)):
-                d = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-                if d <= r + 0.5:
-                    t = min(1.0, d / r)
-                    gc = c_inner.lerp(c_outer, t)
-                    if d <= r - 0.5:
-                        self.set(x, y, gc)
-                    else:
-                        a = r + 0.5 - d
-                        self.seta(x, y, gc, a)
+        d, region = self._disc_dist(cx, cy, r)
+        # Same 8.8 fixed-point mix as every other blend, inner -> outer
+        t = np.minimum(1.0, d / r)
+        gc = [blend_over(ci, co, t) for ci, co in zip(c_inner, c_outer)]
+        self._blend(region, *gc, np.clip(r + 0.5 - d, 0.0, 1.0))
 
     def ring_aa(self, cx: float, cy: float, r: float, thickness: float, c: Color) -> None:
         """Anti-aliased ring (hollow circle)."""
         inner = r - thickness / 2
         outer = r + thickness / 2
-        for y in range(int(cy - outer - 2), int(cy + outer + 3)):
-            for x in range(int(cx - outer - 2), int(cx + outer + 3)):
-                d = math.sqrt((x - cx) ** 2 + (y - cy) ** 2)
-                if inner - 0.5 <= d <= outer + 0.5:
-                    # Compute alpha based on distance from ring edges
-                    a_outer = max(0, min(1, outer + 0.5 - d))
-                    a_inner = max(0, min(1, d - inner + 0.5))
-                    a = min(a_outer, a_inner)
-                    self.seta(x, y, c, a)
+        d, region = self._disc_dist(cx, cy, outer)
+        # Alpha based on distance from ring edges
+        a = np.minimum(np.clip(outer + 0.5 - d, 0.0, 1.0), np.clip(d - inner + 0.5, 0.0, 1.0))
+        self._blend(region, *c, a)
 
     def ring(self, cx: int, cy: int, r0: int, r1: int, c: Color) -> None:
         # fill circle r1 then punch with bg by setting inner to bg later (handled by caller)
@@ -211,11 +277,8 @@ def icon_settings(w: int, h: int, bg: Color, palette: dict) -> Canvas:
     
     # Gear teeth
     teeth = 8
-    for i in range(teeth):
-        ang = (2 * math.pi * i) / teeth
-        tx = cx + math.cos(ang) * 22
-        ty = cy + math.sin(ang) * 22
-        cv.fill_circle_aa(tx, ty, 6, fg)
+    angs = np.linspace(0, 2 * np.pi, teeth, endpoint=False)
+    cv.fill_circles_aa(cx + np.cos(angs) * 22, cy + np.sin(angs) * 22, 6, fg)
     
     # Center knob with highlight
     cv.fill_circle_gradient(cx, cy, 8, Color(255, 255, 255), accent)
@@ -259,12 +322,12 @@ def icon_live(w: int, h: int, bg: Color, palette: dict) -> Canvas:
     green = palette.get("green", Color(80, 220, 120))
     
     # Circular arc suggesting motion
-    for i in range(180):
-        ang = math.radians(i - 45)
-        x = cx + math.cos(ang) * 22
-        y = cy + math.sin(ang) * 22
-        fade = 0.3 + 0.7 * (i / 180)
-        cv.fill_circle_aa(x, y, 2.5 * fade, fg.lerp(accent, fade))
+    angs = np.radians(np.arange(180) - 45)
+    fades = 0.3 + 0.7 * (np.arange(180) / 180)
+    cv.fill_circles_aa(
+        cx + np.cos(angs) * 22, cy + np.sin(angs) * 22, 2.5 * fades,
+        [fg.lerp(accent, fade) for fade in fades],
+    )
     
     # Arrow head at end of arc
     ang_end = math.radians(135)
@@ -277,19 +340,32 @@ def icon_live(w: int, h: int, bg: Color, palette: dict) -> Canvas:
     tri_cx = cx
     tri_cy = cy
     
-    # Draw filled triangle
-    for y in range(int(tri_cy - 10), int(tri_cy + 11)):
-        row_t = (y - (tri_cy - 10)) / 20.0
-        hw = 7 * min(row_t * 2, 2 - row_t * 2)  # Diamond shape rotated
-        x_start = tri_cx - 5 + row_t * 10
-        for x in range(int(x_start - hw), int(x_start + hw + 1)):
-            # Distance to triangle bounds
-            dist_to_edge = hw - abs(x - x_start)
-            if dist_to_edge > 0.5:
-                c = green.lerp(Color(150, 255, 180), 0.3)
-                cv.set(int(x), y, c)
-            elif dist_to_edge > -0.5:
-                cv.seta(int(x), y, green, dist_to_edge + 0.5)
+    # Draw filled triangle: every row at once, one column span per row
+    y0, y1 = int(tri_cy - 10), int(tri_cy + 11)
+    ys = np.arange(y0, y1)[:, None]
+    row_t = (ys - (tri_cy - 10)) / 20.0
+    hw = 7 * np.minimum(row_t * 2, 2 - row_t * 2)  # Diamond shape rotated
+    x_start = tri_cx - 5 + row_t * 10
+    span_lo = (x_start - hw).astype(int)
+    span_hi = (x_start + hw + 1).astype(int)
+    x0, x1 = int(span_lo.min()), int(span_hi.max())
+    xs = np.arange(x0, x1)[None, :]
+    in_span = (xs >= span_lo) & (xs < span_hi)
+    
+    # Distance to triangle bounds
+    dist_to_edge = hw - np.abs(xs - x_start)
+    solid = in_span & (dist_to_edge > 0.5)
+    edge = in_span & ~solid & (dist_to_edge > -0.5)
+    
+    # Clip to the canvas; crop the masks to match
+    cy0, cy1 = max(0, y0), min(h, y1)
+    cx0, cx1 = max(0, x0), min(w, x1)
+    if cy0 >= cy1 or cx0 >= cx1:
+        return cv
+    local = (slice(cy0 - y0, cy1 - y0), slice(cx0 - x0, cx1 - x0))
+    region = (slice(cy0, cy1), slice(cx0, cx1))
+    cv.fill_alpha(region, green.lerp(Color(150, 255, 180), 0.3), solid[local].astype(float))
+    cv.fill_alpha(region, green, np.where(edge, dist_to_edge + 0.5, 0.0)[local])
     
     return cv
 
@@ -307,12 +383,8 @@ def icon_terminal(w: int, h: int, bg: Color, palette: dict) -> Canvas:
     
     # Terminal body (rounded corners via circles)
     corner_r = 6
-    for y in range(int(ry + corner_r), int(ry + rect_h - corner_r)):
-        for x in range(int(rx), int(rx + rect_w)):
-            cv.set(x, y, fg)
-    for x in range(int(rx + corner_r), int(rx + rect_w - corner_r)):
-        for y in range(int(ry), int(ry + rect_h)):
-            cv.set(x, y, fg)
+    cv.fill_rect(int(rx), int(ry + corner_r), int(rx + rect_w), int(ry + rect_h - corner_r), fg)
+    cv.fill_rect(int(rx + corner_r), int(ry), int(rx + rect_w - corner_r), int(ry + rect_h), fg)
     cv.fill_circle_aa(rx + corner_r, ry + corner_r, corner_r, fg)
     cv.fill_circle_aa(rx + rect_w - corner_r, ry + corner_r, corner_r, fg)
     cv.fill_circle_aa(rx + corner_r, ry + rect_h - corner_r, corner_r, fg)
@@ -320,9 +392,10 @@ def icon_terminal(w: int, h: int, bg: Color, palette: dict) -> Canvas:
     
     # Inner dark area
     inner_margin = 4
-    for y in range(int(ry + inner_margin + 6), int(ry + rect_h - inner_margin)):
-        for x in range(int(rx + inner_margin), int(rx + rect_w - inner_margin)):
-            cv.set(x, y, bg)
+    cv.fill_rect(
+        int(rx + inner_margin), int(ry + inner_margin + 6),
+        int(rx + rect_w - inner_margin), int(ry + rect_h - inner_margin), bg,
+    )
     
     # Title bar with dots
     cv.fill_circle_aa(rx + 10, ry + 6, 2.5, Color(255, 95, 86))   # Red
@@ -382,44 +455,47 @@ def icon_home(w: int, h: int, bg: Color, palette: dict) -> Canvas:
 
 
 def write_header(out_path: Path, icons: dict[str, Canvas], bg565: int) -> None:
-    def fmt_u16(v: int) -> str:
-        return f"0x{v:04x}"  # lower-case hex
-
-    lines: list[str] = []
-    lines.append("#pragma once")
-    lines.append("\n// Auto-generated by tools/generate_menu_icons.py")
-    lines.append("// Icons are RGB565 with anti-aliasing and gradient effects.")
-    lines.append("// Chroma-key transparent background for compositing.")
-    lines.append("\n#include <cstdint>")
-    lines.append("\nnamespace ui::assets {\n")
-    lines.append(f"static constexpr uint16_t kTransparent565 = {fmt_u16(bg565)};\n")
+    # Accumulate the whole header in memory and write it out once
+    buf = io.StringIO()
+    emit = functools.partial(print, file=buf)
+
+    emit("#pragma once")
+    emit()
+    emit("// Auto-generated by tools/generate_menu_icons.py")
+    emit("// Icons are RGB565 with anti-aliasing and gradient effects.")
+    emit("// Chroma-key transparent background for compositing.")
+    emit()
+    emit("#include <cstdint>")
+    emit()
+    emit("namespace ui::assets {")
+    emit()
+    emit(f"static constexpr uint16_t kTransparent565 = 0x{bg565:04x};")  # lower-case hex
+    emit()
 
     for name, cv in icons.items():
         arr_name = f"kIcon_{name}".replace("-", "_")
-        lines.append(f"static constexpr int {arr_name}_W = {cv.w};")
-        lines.append(f"static constexpr int {arr_name}_H = {cv.h};")
-        lines.append(f"static const uint16_t {arr_name}[{cv.w * cv.h}] = {{")
-
-        # Write row-major; 12 values per line.
-        row: list[str] = []
-        for i, p in enumerate(cv.px):
-            row.append(fmt_u16(p.to_rgb565()))
-            if len(row) == 12:
-                lines.append("  " + ", ".join(row) + ",")
-                row = []
-        if row:
-            lines.append("  " + ", ".join(row) + ",")
-        lines.append("};\n")
-
-    lines.append("} // namespace ui::assets\n")
+        emit(f"static constexpr int {arr_name}_W = {cv.w};")
+        emit(f"static constexpr int {arr_name}_H = {cv.h};")
+        emit(f"static const uint16_t {arr_name}[{cv.w * cv.h}] = {{")
+
+        # Write row-major; format every value in C, then join 12 per line.
+        hex_values = np.char.mod("0x%04x", cv.to_rgb565().ravel()).tolist()
+        emit("\n".join(
+            "  " + ", ".join(hex_values[i:i + 12]) + ","
+            for i in range(0, len(hex_values), 12)
+        ))
+        emit("};")
+        emit()
+
+    emit("} // namespace ui::assets")
+    emit()
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    out_path.write_text(buf.getvalue(), encoding="utf-8")
 
 
 def main() -> None:
-    w = 64
-    h = 64
+    w = h = CANVAS_SIZE
     bg = Color(0, 0, 0)  # chroma-key transparent
     
     # Color palette for a modern, cohesive look
@@ -430,6 +506,8 @@ def main() -> None:
         "green": Color(80, 220, 120),    # For live/play
     }
 
+    # Each icon is independent, but the whole set renders in ~10 ms; spawning
+    # a process pool costs more than that, so generate them serially.
     icons: dict[str, Canvas] = {
         "home": icon_home(w, h, bg, palette),
         "settings": icon_settings(w, h, bg, palette),